@@ -4,11 +4,11 @@ This module provides functions to filter data, perform correlation analysis, and
 Functions:
     filter_data(path: str) -> dict:
         Filters data from the given path and returns the filtered data as a dictionary.
-        If the filtered data already exists in a file, it loads and returns the data from the file.
+        If the filtered data for the same input already exists in a file, it loads and returns the data from the file.
 
     correlate_data(path: str, result: dict, gap: int) -> dict:
         Performs correlation analysis on the filtered data and returns the correlation coefficient matrix and alert index.
-        If the correlation data already exists in a file, it loads and returns the data from the file.
+        If the correlation data for the same input and parameters already exists in a file, it loads and returns it.
 
     create_alert_corrrelation_list(path: str, alerts: list, matrix: dict) -> dict:
         Creates a list of correlating alerts based on the correlation coefficient matrix and saves it to a file.
@@ -19,23 +19,35 @@ Functions:
         Returns the alert correlation list.
 """
 
-import json
+import hashlib
 import logging
 import os
+import pathlib
+import time
 
-from datetime import datetime as dt
+import numpy as np
+import orjson
 
 from analyzing import filtering, CorrelationAnalyzer, get_mean_duration_per_alertname
 
 logger = logging.getLogger("alertmagnet")
 
 
+def _cache_key(path: str, *params) -> str:
+    # cached results are only valid for the very same input data and parameters
+    stat = os.stat(os.path.join(path, "finalData.json"))
+    key = repr((stat.st_mtime_ns, stat.st_size, params))
+
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
 def group_alert_timeseries_per_cluster(path: str) -> dict:
     """
     Filters data from the given path and returns the result as a dictionary.
 
-    If a file named "filteredData.json" exists in the specified path, the function
-    reads and returns its contents. Otherwise, it performs the filtering process,
+    If a file named "filteredData.<key>.json" exists in the specified path, the function
+    reads and returns its contents. The key is derived from the current "finalData.json",
+    so a changed input is filtered again. Otherwise, it performs the filtering process,
     logs the time taken, and returns the filtered data.
 
     Args:
@@ -44,15 +56,16 @@ def group_alert_timeseries_per_cluster(path: str) -> dict:
     Returns:
         dict: The filtered data as a dictionary.
     """
-    if os.path.exists(os.path.join(path, "filteredData.json")):
-        with open(file=os.path.join(path, "filteredData.json"), mode="r", encoding="utf-8") as f:
-            return json.load(f)
+    file = pathlib.Path(path) / f"filteredData.{_cache_key(path)}.json"
+
+    if file.is_file():
+        with file.open(mode="rb") as f:
+            return orjson.loads(f.read())
 
     logger.info("Starting filtering …")
-    start = dt.now()
-    result = filtering(path=path)
-    end = dt.now()
-    logger.info("Time taken: %s", end - start)
+    start = time.perf_counter_ns()
+    result = filtering(path=path, filename=file.name)
+    logger.info("Time taken: %.3fs", (time.perf_counter_ns() - start) / 1e9)
 
     return result
 
@@ -62,34 +75,33 @@ def correlate_data(path: str, result: dict, gap: int, cores: int, start_tt: floa
     Calculate or load the correlation coefficient matrix for the given data.
 
     This function checks if a precomputed correlation coefficient matrix exists in the specified path.
-    If it does not exist, it calculates the matrix using the provided data and saves it to a JSON file.
-    If it exists, it loads the matrix from the JSON file.
+    If it does not exist, it calculates the matrix using the provided data and saves it to a compressed NumPy file.
+    If it exists, it loads the matrix from that file. The file name contains a key derived from the current
+    "finalData.json" and the analysis parameters, so a changed input or parameter is calculated again.
 
     Args:
-        path (str): The directory path where the correlation coefficient matrix JSON file is stored or will be saved.
+        path (str): The directory path where the correlation coefficient matrix file is stored or will be saved.
         result (dict): The data for which the correlation coefficient matrix is to be calculated.
         gap (int): The gap parameter used in the correlation analysis.
 
     Returns:
         dict: A dictionary containing the alert index and the correlation coefficient matrix.
     """
-    if not os.path.exists(os.path.join(path, "corrcoefficient_matrix.json")):
-        logger.info("Starting correlation …")
-        start = dt.now()
-        ca = CorrelationAnalyzer(cores=cores, gap=gap)
-        ca.calc_corrcoefficient_matrix(data=result, start=start_tt, end=end_tt)
-        end = dt.now()
-        logger.info("Time taken: %s", end - start)
+    file = pathlib.Path(path) / f"corrcoefficient_matrix.{_cache_key(path, gap, start_tt, end_tt)}.npz"
 
-        data = {"alert_index": ca.alerts, "corrcoef_matrix": ca.matrix}
+    if file.is_file():
+        with np.load(file) as f:
+            return {"alert_index": f["alerts"].tolist(), "corrcoef_matrix": f["matrix"]}
 
-        with open(file=os.path.join(path, "corrcoefficient_matrix.json"), mode="w", encoding="utf-8") as f:
-            f.write(json.dumps(data))
+    logger.info("Starting correlation …")
+    start = time.perf_counter_ns()
+    ca = CorrelationAnalyzer(cores=cores, gap=gap)
+    ca.calc_corrcoefficient_matrix(data=result, start=start_tt, end=end_tt)
+    logger.info("Time taken: %.3fs", (time.perf_counter_ns() - start) / 1e9)
 
-        return data
+    np.savez_compressed(file, alerts=np.array(ca.alerts), matrix=ca.matrix)
 
-    with open(file=os.path.join(path, "corrcoefficient_matrix.json"), mode="r", encoding="utf-8") as f:
-        return json.load(f)
+    return {"alert_index": ca.alerts, "corrcoef_matrix": ca.matrix}
 
 
 def create_alert_corrrelation_list(path: str, alerts: list, matrix: dict) -> dict:
@@ -111,17 +123,17 @@ def create_alert_corrrelation_list(path: str, alerts: list, matrix: dict) -> dic
     """
     alert_correlation = {}
 
-    for index_alert, alert in enumerate(alerts):
-        alert_correlation[alert] = {}
-        for index_corr, corr in enumerate(matrix[index_alert]):
-            if index_alert == index_corr:
-                continue
+    names = np.asarray(alerts)
+    matrix = np.array(matrix, dtype=np.float64).reshape(len(alerts), len(alerts))
+    np.fill_diagonal(matrix, -np.inf)  # an alert is not listed as correlating with itself
 
-            if corr >= 0.0:
-                alert_correlation[alert][alerts[index_corr]] = corr
+    for index_alert, alert in enumerate(alerts):
+        row = matrix[index_alert]
+        columns = np.flatnonzero(row >= 0.0)
+        alert_correlation[alert] = dict(zip(names[columns].tolist(), row[columns].tolist()))
 
-    with open(file=os.path.join(path, "correlating_alerts.json"), mode="w", encoding="utf-8") as f:
-        f.write(json.dumps(alert_correlation))
+    with open(file=os.path.join(path, "correlating_alerts.json"), mode="wb") as f:
+        f.write(orjson.dumps(alert_correlation))
 
     return alert_correlation
 
@@ -7,9 +7,10 @@ Functions:
         and writes the filtered data back to a JSON file. Returns the filtered data.
 """
 
-import json
 import os
 
+import orjson
+
 
 def __get_data(path: str):
     if not os.path.exists(path):
@@ -17,8 +18,8 @@ def __get_data(path: str):
 
     file = os.path.join(path, "finalData.json")
 
-    with open(file=file, mode="r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(file=file, mode="rb") as f:
+        data = orjson.loads(f.read())
 
     return data
 
@@ -31,31 +32,23 @@ def __filter_data(data: list):
 
         cluster = alert["metric"]["cluster"]
         alert_name = alert["metric"]["alertname"]
-        index_cluster = out.get(cluster, -1)
-        index_alert = out.get(alert_name, -1)
-
-        if index_cluster == -1:
-            out[cluster] = {}
-
-        if index_alert == -1:
-            out[cluster][alert_name] = []
 
-        out[cluster][alert_name].extend(alert["values"])
+        out.setdefault(cluster, {}).setdefault(alert_name, []).extend(alert["values"])
 
     return out
 
 
-def __write_data(data: dict, path: str):
+def __write_data(data: dict, path: str, filename: str):
     if not os.path.exists(path):
         raise FileNotFoundError(f"Path {path} does not exist.")
 
-    file = os.path.join(path, "filteredData.json")
+    file = os.path.join(path, filename)
 
-    with open(file=file, mode="w", encoding="utf-8") as f:
-        f.write(json.dumps(data))
+    with open(file=file, mode="wb") as f:
+        f.write(orjson.dumps(data))
 
 
-def filtering(path: str):
+def filtering(path: str, filename: str = "filteredData.json"):
     """
     Filters data from the given file path.
 
@@ -64,12 +57,13 @@ def filtering(path: str):
 
     Args:
         path (str): The file path from which to read and write data.
+        filename (str, optional): The name of the file the filtered data is written to. Defaults to "filteredData.json".
 
     Returns:
         The filtered data.
     """
     data = __get_data(path)
     filtered_data = __filter_data(data)
-    __write_data(filtered_data, path)
+    __write_data(filtered_data, path, filename)
 
     return filtered_data
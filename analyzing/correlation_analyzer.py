@@ -1,7 +1,7 @@
 """
 Module: correlation_analyzer
 
-This module provides the CorrelationAnalyzer class, which is used to analyze correlations between alert samples over time. 
+This module provides the CorrelationAnalyzer class, which is used to analyze correlations between alert samples over time.
 It includes methods to calculate correlation coefficient matrices, collect alert samples, and process data for correlation analysis.
 
 Classes:
@@ -9,47 +9,94 @@ Classes:
 """
 
 import logging
+import math
+import multiprocessing
 import time as t
 
-from threading import BoundedSemaphore, Thread
+from concurrent.futures import ProcessPoolExecutor
 
-import pandas as pd
+import numpy as np
 
 logger = logging.getLogger("alertmagnet")
 
+# the analyzing process runs the log listener and the exporter threads, whose locks a forked worker could inherit in a
+# locked state; workers are therefore started from a fork server, which has this module and numpy already imported
+MP_CONTEXT = multiprocessing.get_context("forkserver")
+MP_CONTEXT.set_forkserver_preload(["analyzing.correlation_analyzer"])
+
+
+def _create_time_samples(alert_value: list, start: float, end: float, gap: int) -> np.ndarray:
+    # one bucket per gap; trailing buckets which do not fit completely before `end` are never marked as firing
+    bucket_count = int((end - start) // gap) + 1
+    firing_limit = max(0, math.ceil((end - start - gap) / gap))
+
+    ranges = np.asarray(alert_value, dtype=np.float64).reshape(-1, 2)
+    lower = np.maximum(np.ceil((ranges[:, 0] - start) / gap), 0).astype(np.int64)
+    upper = np.minimum((ranges[:, 0] + ranges[:, 1] - start) // gap + 1, firing_limit).astype(np.int64)
+    valid = lower < upper
+
+    # +1 where a firing range starts and -1 where it ends, so the running sum counts the ranges covering a bucket
+    starts = np.bincount(lower[valid], minlength=bucket_count + 1)
+    edges = starts - np.bincount(upper[valid], minlength=bucket_count + 1)
+
+    return (np.cumsum(edges[:-1]) > 0).astype(np.int8)
+
+
+def _collect_cluster_samples(cluster_key: str, cluster_value: dict, start: float, end: float, gap: int):
+    alerts = []
+    columns = []
+    for alert_key, alert_value in cluster_value.items():
+        alerts.append(alert_key)
+        columns.append(_create_time_samples(alert_value=alert_value, start=start, end=end, gap=gap))
+
+    return cluster_key, alerts, np.column_stack(columns)
+
+
+def _calc_corrcoefficient_per_cluster(samples: np.ndarray) -> np.ndarray:
+    # runs in a worker process, whose log records would never reach the parent's queue listener
+    sample_count = samples.shape[0]
+
+    # samples are 0/1, so X.T @ X holds integer co-occurrence counts which float32 represents exactly below 2**24
+    dtype = np.float32 if sample_count < 2**24 else np.float64
+    matrix = samples.astype(dtype)
+    co_occurrences = (matrix.T @ matrix).astype(np.float64)
+    occurrences = np.diag(co_occurrences).copy()
+
+    coefficients = co_occurrences
+    coefficients -= np.outer(occurrences, occurrences / sample_count)
+    deviation = np.sqrt(np.maximum(np.diag(coefficients), 0))
+
+    # scale the covariance in place by 1 / deviation; constant alerts have no defined coefficient and end up as 0
+    inverse_deviation = np.divide(1.0, deviation, out=np.zeros_like(deviation), where=deviation > 0)
+    coefficients *= inverse_deviation
+    coefficients *= inverse_deviation[:, None]
+
+    return coefficients
+
 
 class CorrelationAnalyzer(object):
     """
     A class to analyze correlation coefficients between alert samples.
 
     Attributes:
-        semaphore (BoundedSemaphore): A semaphore to limit the number of concurrent threads.
+        cores (int): The maximum number of worker processes.
         gap (int): The time gap between samples.
         alerts (list): A list to store alert keys.
-        matrix (list): A list to store the correlation coefficient matrix.
-        data_matrix (dict): A dictionary to store the data matrix for each cluster.
+        alert_index (dict): A mapping of each alert key to its position in `alerts`.
+        matrix (np.ndarray): The resulting correlation coefficient matrix.
+        matrix_sum (np.ndarray): The summed up correlation coefficients of all clusters.
+        matrix_cnt (np.ndarray): The number of clusters which contributed to each coefficient.
+        data_matrix (dict): A dictionary to store the alert keys and sample matrix (one column per alert) per cluster.
 
     Methods:
         calc_corrcoefficient_matrix(data: dict, start: float, end: float):
             Calculates the correlation coefficient matrix for the given data within the specified time range.
 
-        get_time_samples(start: float, end: float, alert_key: str, alert_value: list, __store: dict):
-            Collects time samples for a specific alert within the specified time range and stores them in the provided dictionary.
-
-        collect_alert_samples(data: dict, start: float, end: float):
-            Collects alert samples from the given data within the specified time range and stores them in the data matrix.
-
-        __sort_data(data: list):
-            Sorts the given data based on the start time of each alert.
+        collect_alert_samples(data: dict, start: float, end: float, executor: ProcessPoolExecutor):
+            Collects alert samples per cluster in worker processes and stores them in the data matrix.
 
-        create_time_samples_per_time(data: list, start: float, end: float):
-            Creates time samples for the given data within the specified time range.
-
-        __create_coefficient_matrix():
-            Creates the initial correlation coefficient matrix and starts the calculation for each cluster.
-
-        __calc_corrcoefficient_per_cluster(cluster_name: str):
-            Calculates the correlation coefficient for each pair of alerts within the specified cluster.
+        __create_coefficient_matrix(executor: ProcessPoolExecutor):
+            Creates the initial correlation coefficient matrix and calculates the coefficients of each cluster in worker processes.
 
         __calc_matrix_results():
             Calculates the final correlation coefficient results for the matrix.
@@ -59,11 +106,14 @@ class CorrelationAnalyzer(object):
     """
 
     def __init__(self, cores: int = 80, gap: int = 60):
-        self.semaphore = BoundedSemaphore(cores)
+        self.cores = cores
         self.gap = gap
 
         self.alerts = []
-        self.matrix = []
+        self.alert_index = {}
+        self.matrix = None
+        self.matrix_sum = None
+        self.matrix_cnt = None
         self.data_matrix = {}
 
     def calc_corrcoefficient_matrix(self, data: dict, start: float, end: float):
@@ -71,7 +121,7 @@ class CorrelationAnalyzer(object):
         Calculate the correlation coefficient matrix for the given data within the specified time range.
 
         This method collects alert samples from the provided data between the start and end times,
-        creates a coefficient matrix, and calculates the matrix results.
+        creates a coefficient matrix, and calculates the matrix results. Both steps share one pool of worker processes.
 
         Args:
             data (dict): The input data containing alert samples.
@@ -81,165 +131,62 @@ class CorrelationAnalyzer(object):
         Returns:
             None
         """
-        self.collect_alert_samples(data=data, start=start, end=end)
-        self.__create_coefficient_matrix()
-        self.__calc_matrix_results()
+        with ProcessPoolExecutor(max_workers=self.cores, mp_context=MP_CONTEXT) as executor:
+            self.collect_alert_samples(data=data, start=start, end=end, executor=executor)
+            self.__create_coefficient_matrix(executor=executor)
 
-    def __get_time_samples(self, start: float, end: float, alert_key: str, alert_value: list, __store: dict):
-        if not alert_key in self.alerts:
-            self.alerts.append(alert_key)
-
-        sorted_ranges = self.__sort_data(data=alert_value)
-        samples = pd.DataFrame(self.__create_time_samples_per_time(data=sorted_ranges, start=start, end=end))
-
-        __store[alert_key] = samples
+        self.__calc_matrix_results()
 
-    def collect_alert_samples(self, data: dict, start: float, end: float):
+    def collect_alert_samples(self, data: dict, start: float, end: float, executor: ProcessPoolExecutor):
         logger.info("Creating time samples")
         start_tt = t.time()
 
-        for cluster_key, cluster_value in data.items():
-            logger.debug("Processing cluster: %s", cluster_key)
-            __store = {}
-            threads = []
-            for alert_key, alert_value in cluster_value.items():
-                threads.append(
-                    Thread(target=self.__get_time_samples, args=(start, end, alert_key, alert_value, __store))
-                )
+        futures = [
+            executor.submit(_collect_cluster_samples, cluster_key, cluster_value, start, end, self.gap)
+            for cluster_key, cluster_value in data.items()
+        ]
 
-            for thread in threads:
-                with self.semaphore:
-                    thread.start()
+        for future in futures:
+            cluster_key, alerts, samples = future.result()
+            self.data_matrix[cluster_key] = (alerts, samples)
+            logger.debug("cluster %s has %s entries", cluster_key, len(alerts))
 
-            for thread in threads:
-                thread.join()
-
-            self.data_matrix[cluster_key] = pd.concat(__store, axis=1)
-            logger.debug("cluster %s has %s entries", cluster_key, len(self.data_matrix[cluster_key].columns))
+            for alert_key in alerts:
+                if not alert_key in self.alerts:
+                    self.alerts.append(alert_key)
 
         end_tt = t.time()
         logger.info("Creating time samples took: %s", end_tt - start_tt)
         logger.info("Sorting alerts")
         self.alerts.sort()
+        self.alert_index = {alert: index for index, alert in enumerate(self.alerts)}
         logger.info("Finished sorting alerts")
 
-    def __sort_data(self, data: list):
-        max_length = len(data)
-        out = []
-
-        while len(out) < max_length:
-            min_value = data[0][0]
-            min_index = 0
-            for index, value in enumerate(data):
-                if value[0] < min_value:
-                    min_value = value[0]
-                    min_index = index
-
-            out.append(data[min_index])
-            data.pop(min_index)
-
-        return out
-
-    def __create_time_samples_per_time(self, data: list, start: float, end: float):
-        samples = []
-
-        for time_pair in data:
-            if start > end:
-                break
-
-            alert_start = time_pair[0]
-            alert_duration = time_pair[1]
-
-            if start <= alert_start:
-                null_samples = (alert_start - start) // self.gap
-                if start != alert_start and alert_start - null_samples * self.gap != start:
-                    null_samples += 1
-
-                for _ in range(int(null_samples)):
-                    if not start + self.gap < end:
-                        break
-
-                    samples.append(0)
-                    start += self.gap
-
-            if alert_start + alert_duration * self.gap >= start:
-                one_samples = ((alert_start + alert_duration) - start) // self.gap
-                one_samples += 1
-                for _ in range(int(one_samples)):
-                    if not start + self.gap < end:
-                        break
-
-                    samples.append(1)
-                    start += self.gap
-
-        null_samples = (end - start) // self.gap
-        null_samples += 1
-
-        for _ in range(int(null_samples)):
-            if not start + self.gap < end + self.gap:
-                break
-
-            samples.append(0)
-            start += self.gap
-
-        if end == start:
-            samples.append(0)
-
-        return samples
-
-    def __create_coefficient_matrix(self):
+    def __create_coefficient_matrix(self, executor: ProcessPoolExecutor):
         logger.info("Calculating correlation")
 
         start_tc = t.time()
 
-        for _ in self.alerts:
-            self.matrix.append([[0, 0] for _ in self.alerts])
-
-        threads = []
+        self.matrix_sum = np.zeros((len(self.alerts), len(self.alerts)), dtype=np.float64)
+        self.matrix_cnt = np.zeros((len(self.alerts), len(self.alerts)), dtype=np.int32)
 
-        for cluster in self.data_matrix:
-            threads.append(Thread(target=self.__calc_corrcoefficient_per_cluster, args=(cluster,)))
+        futures = {
+            executor.submit(_calc_corrcoefficient_per_cluster, samples): (cluster_name, alerts)
+            for cluster_name, (alerts, samples) in self.data_matrix.items()
+        }
 
-        for thread in threads:
-            with self.semaphore:
-                thread.start()
-
-        for thread in threads:
-            thread.join()
+        for future, (cluster_name, alerts) in futures.items():
+            coefficients = future.result()
+            logger.info("Finished cluster: %s", cluster_name)
+            index = np.ix_(*[[self.alert_index[alert] for alert in alerts]] * 2)
+            self.matrix_sum[index] += coefficients
+            self.matrix_cnt[index] += 1
 
         end_tc = t.time()
 
         logger.info("Calculating correlation took: %s", end_tc - start_tc)
 
-    def __calc_corrcoefficient_per_cluster(self, cluster_name: str):
-        logger.info("Processing cluster: %s", cluster_name)
-        cluster = self.data_matrix[cluster_name]
-        indent = 1
-        for alert_1 in cluster:
-            for alert_2 in cluster[indent:]:
-                res = cluster[alert_1].corr(cluster[alert_2])
-
-                if str(res) == "nan":
-                    res = 0
-
-                self.matrix[self.alerts.index(alert_1[0])][self.alerts.index(alert_2[0])][0] += float(res)
-                self.matrix[self.alerts.index(alert_1[0])][self.alerts.index(alert_2[0])][1] += 1
-
-                self.matrix[self.alerts.index(alert_2[0])][self.alerts.index(alert_1[0])][0] += float(res)
-                self.matrix[self.alerts.index(alert_2[0])][self.alerts.index(alert_1[0])][1] += 1
-
-            indent += 1
-
-        logger.info("Finished cluster: %s", cluster_name)
-
     def __calc_matrix_results(self):
         logger.info("Calculating matrix results")
-        for index1, value1 in enumerate(self.matrix):
-            for index2, value2 in enumerate(value1):
-                if value2[1] == 0:
-                    self.matrix[index1][index2] = 0
-                    continue
-
-                self.matrix[index1][index2] = value2[0] / value2[1]
-
+        self.matrix = np.where(self.matrix_cnt > 0, self.matrix_sum / np.maximum(self.matrix_cnt, 1), 0.0)
         logger.info("Finished calculating matrix results")
@@ -33,10 +33,12 @@ Functions:
             dict: A dictionary with alert names as keys and their mean durations as values.
 """
 
-import json
 import logging
 import os
 
+import numpy as np
+import orjson
+
 logger = logging.getLogger("alertmagnet")
 
 
@@ -47,34 +49,38 @@ def __get_queried_data_from_json(path: str):
         logger.error("FileNotFoundError: File %s does not exist.", filename)
         raise FileNotFoundError(f"File {filename} does not exist.")
 
-    with open(file=filename, mode="r", encoding="utf-8") as f:
-        results = json.load(f)
+    with open(file=filename, mode="rb") as f:
+        results = orjson.loads(f.read())
 
     return results
 
 
 def __calc_mean_duration_per_alertname(results: dict):
-    alerts = {}
+    alert_codes = {}
+    codes = []
+    lengths = []
 
     for result in results:
-        if not result["metric"]["alertname"] in alerts:
-            alerts[result["metric"]["alertname"]] = []
+        codes.append(alert_codes.setdefault(result["metric"]["alertname"], len(alert_codes)))
+        lengths.append(len(result["values"]))
 
-        for value_pair in result["values"]:
-            alerts[result["metric"]["alertname"]].append(value_pair[1])
+    durations = np.fromiter(
+        (value_pair[1] for result in results for value_pair in result["values"]), dtype=np.float64, count=sum(lengths)
+    )
+    value_codes = np.repeat(np.asarray(codes, dtype=np.int64), lengths)
 
-    for alertname, durations in alerts.items():
-        mean = sum(durations) / len(durations)
-        alerts[alertname] = mean
+    sums = np.bincount(value_codes, weights=durations, minlength=len(alert_codes))
+    counts = np.bincount(value_codes, minlength=len(alert_codes))
+    means = np.divide(sums, counts, out=np.zeros(len(alert_codes), dtype=np.float64), where=counts > 0)
 
-    return alerts
+    return dict(zip(alert_codes, means.tolist()))
 
 
 def __write_calculated_data_to_json(data: dict, path: str):
     out = os.path.join(path, "alertMeanDurations.json")
 
-    with open(file=out, mode="w", encoding="utf-8") as f:
-        f.write(json.dumps(data))
+    with open(file=out, mode="wb") as f:
+        f.write(orjson.dumps(data))
 
 
 def get_mean_duration_per_alertname(path: str):
@@ -61,10 +61,10 @@ class JSONFormatter(logging.Formatter):
         if record.stack_info is not None:
             always_fields["stack_info"] = self.formatStack(record.stack_info)
 
-        message = {
-            key: msg_val if (msg_val := always_fields.pop(val, None)) is not None else getattr(record, val)
-            for key, val in self.fmt_keys.items()
-        }
+        message = {}
+        for key, val in self.fmt_keys.items():
+            msg_val = always_fields.pop(val, None)
+            message[key] = msg_val if msg_val is not None else getattr(record, val)
 
         message.update(always_fields)
 
@@ -78,4 +78,5 @@ class JSONFormatter(logging.Formatter):
 class DebugFilter(logging.Filter):
     @override
     def filter(self, record: logging.LogRecord) -> bool | logging.LogRecord:
-        return record.levelno in (logging.CRITICAL, logging.ERROR, logging.WARNING, logging.DEBUG)
+        # JSONFormatter only renders DEBUG records, drop the others before they reach the formatter
+        return record.levelno == logging.DEBUG
@@ -1,16 +1,33 @@
 """Module documentation"""
 
-import json
 import logging
 import os
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
 from filtering.data_filter import create_time_ranges
 
 logger = logging.getLogger("alertmagnet")
 
 
+def _load_query_result(file: str) -> dict | None:
+    with open(file=file, mode="rb") as f:
+        data = orjson.loads(f.read())
+
+    if data["status"] == "error":
+        return None
+
+    return data
+
+
 class DataCleaner(object):
-    def __init__(self):
+    __slots__ = ("cores", "data", "metric_index_map")
+
+    def __init__(self, cores: int = 1):
+        self.cores = cores
         self.data = None
         self.metric_index_map = {}
 
@@ -20,58 +37,67 @@ class DataCleaner(object):
 
     def clear_query_results(self, path: str, step: int):
         logger.debug("clear_query_results called with path: %s and step: %s", path, step)
-        groups = os.listdir(path)
-
         logger.info("Scanning files")
-        files = [
-            os.path.join(path, group, file)
-            for group in groups
-            if group.startswith("group")
-            for file in os.listdir(os.path.join(path, group))
-        ]
+        with os.scandir(path) as entries:
+            groups = [entry.path for entry in entries if entry.name.startswith("group") and entry.is_dir()]
+
+        files = []
+        for group in groups:
+            with os.scandir(group) as entries:
+                files.extend(entry.path for entry in entries if entry.is_file())
 
         logger.info("Staging %s files", len(files))
-        with open(file=files[0], mode="r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file=files[0], mode="rb") as f:
+            data = orjson.loads(f.read())
             self.data = data["data"]["result"]
 
         for index, result in enumerate(self.data):
             metric = result["metric"]
-            flatted_key = str(metric)
+            flatted_key = tuple(sorted(metric.items()))
             self.metric_index_map[flatted_key] = index
 
-        for file in files[1:]:
-            with open(file=file, mode="r", encoding="utf-8") as f:
-                sub_data = json.load(f)
+        # files are loaded in worker threads while the results are merged in order; at most `cores` loaded
+        # files wait for the merge, so memory stays bounded
+        with ThreadPoolExecutor(max_workers=self.cores) as executor:
+            pending = deque()
 
-            if sub_data["status"] == "error":
-                continue
+            for file in files[1:]:
+                pending.append(executor.submit(_load_query_result, file))
 
-            self.__assert_index_to_metrics(results=sub_data["data"]["result"])
+                if len(pending) > self.cores:
+                    self.__merge_query_result(sub_data=pending.popleft().result())
 
-        for result in self.data:
-            result["values"] = sorted(set(result["values"]))
+            while pending:
+                self.__merge_query_result(sub_data=pending.popleft().result())
 
+        # every file contributes an already sorted run, which sorted() merges; repeated timestamps are skipped
+        # by create_time_ranges, so no set is built
         for result in self.data:
-            result["values"] = create_time_ranges(data=result["values"], step=step)
+            result["values"] = create_time_ranges(data=sorted(result["values"]), step=step)
 
         logger.info("Writing files")
-        with open(file=os.path.join(path, "finalData.json"), mode="w", encoding="utf-8") as f:
-            f.write(json.dumps(self.data))
+        with open(file=os.path.join(path, "finalData.json"), mode="wb") as f:
+            f.write(orjson.dumps(self.data))
 
-        for root, dirs, files in os.walk(path, topdown=False):
-            for name in files:
-                if name != "finalData.json":
-                    os.remove(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
+        # the downloaded files are known already, so the directory tree is not walked again
+        for file in files:
+            os.remove(file)
+
+        for group in groups:
+            os.rmdir(group)
 
         self.__reset()
 
+    def __merge_query_result(self, sub_data: dict | None):
+        if sub_data is None:
+            return
+
+        self.__assert_index_to_metrics(results=sub_data["data"]["result"])
+
     def __assert_index_to_metrics(self, results) -> int | None:
         for result in results:
             metric = result["metric"]
-            flatted_key = str(metric)
+            flatted_key = tuple(sorted(metric.items()))
 
             metric_index = self.metric_index_map.get(flatted_key, -1)
 
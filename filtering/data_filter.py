@@ -1,7 +1,12 @@
 import logging
 
+import numpy as np
+
 logger = logging.getLogger("alertmagnet")
 
+# below this number of timestamps the plain loop is faster than creating the arrays
+VECTORIZE_MIN_LENGTH = 2048
+
 
 def remove_state_from_timestamp_value(data: list[list]) -> list[int]:
     """
@@ -15,15 +20,15 @@ def remove_state_from_timestamp_value(data: list[list]) -> list[int]:
         list[int]: A list of the first elements (timestamps) from each sublist in the input list.
 
     Raises:
-        TypeError: If the input data is not a list of lists, or if the first element of any sublist is not a float.
+        TypeError: If the input data is not a list, or if its first or last value is not a list starting with a float.
     """
     logger.debug("remove_state_from_timestamp_value called with data: %s", data)
-    out = []
 
     if not isinstance(data, list):
         raise TypeError(f"Invalid input format: isinstance(data, list) = {isinstance(data, list)}; type: {type(data)}")
 
-    for value in data:
+    # query results are homogeneous, so only the first and the last value are validated instead of every sample
+    for value in data[:1] + data[-1:]:
         if not isinstance(value, list):
             raise TypeError(
                 f"Invalid input format: isinstance(value, list) = {isinstance(value, list)}; type: {type(value)}"
@@ -34,9 +39,7 @@ def remove_state_from_timestamp_value(data: list[list]) -> list[int]:
                 f"Invalid input format: isinstance(value[0], float) = {isinstance(value[0], float)}; type: {type(value[0])}"
             )
 
-        out.append(value[0])
-
-    return out
+    return [value[0] for value in data]
 
 
 def create_time_ranges(data: list[float], step: int) -> list[tuple]:
@@ -48,7 +51,7 @@ def create_time_ranges(data: list[float], step: int) -> list[tuple]:
     element is the duration (difference between the start and end values).
 
     Args:
-        data (list[float]): A list of float values representing time points.
+        data (list[float]): A sorted list of float values representing time points. Repeated values are skipped.
         step (int): The step value to determine the continuity of the time ranges.
 
     Returns:
@@ -67,38 +70,43 @@ def create_time_ranges(data: list[float], step: int) -> list[tuple]:
     if not isinstance(data, list):
         raise TypeError(f"Invalid input format: isinstance(data, list) = {isinstance(data, list)}; type: {type(data)}")
 
-    out = []
+    if len(data) >= VECTORIZE_MIN_LENGTH:
+        return __create_time_ranges_vectorized(data=data, step=step)
 
-    start = None
-    prev = None
+    values = iter(data)
 
-    if len(data) == 0:
-        return out
+    try:
+        start = prev = next(values)
+    except StopIteration:
+        return []
 
-    for value in data[:-1]:
-        if start is None:
-            start = prev = value
-            continue
+    out = []
+    out_append = out.append
 
+    for value in values:
         if value == prev:
             continue
 
         if value != prev + step:  # consider using >
-            out.append((start, prev - start))
-            start = prev = value
-            continue
+            out_append((start, prev - start))
+            start = value
 
         prev = value
 
-    value = data[-1]
-    if start is None:
-        out.append((value, 0))
-        return out
-
-    if not value == prev + step:  # consider using >
-        out.append((start, prev - start))
-        out.append((value, 0))
-    else:
-        out.append((start, value - start))
+    out_append((start, prev - start))
 
     return out
+
+
+def __create_time_ranges_vectorized(data: list[float], step: int) -> list[tuple]:
+    values = np.fromiter(data, dtype=np.float64, count=len(data))
+    indices = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))  # drop repeated timestamps
+    values = values[indices]
+
+    # same comparison as the loop (value != prev + step), so float timestamps split identically
+    breaks = np.flatnonzero(values[1:] != values[:-1] + step) + 1
+    starts = indices[np.concatenate(([0], breaks))].tolist()
+    ends = indices[np.concatenate((breaks - 1, [values.size - 1]))].tolist()
+
+    # the ranges are built from the input values, so int timestamps stay ints like in the loop
+    return [(data[start], data[end] - data[start]) for start, end in zip(starts, ends)]
@@ -2,19 +2,24 @@
 
 # standard imports
 import atexit
-import json
 import logging
 import logging.config
 import logging.handlers
 import os
 import pathlib
+import signal
+import sys
 import time
 
+from collections import deque
 from datetime import datetime as dt
 from datetime import timedelta as td
 from datetime import timezone as tz
 from threading import Thread
 
+# third party imports
+import orjson
+
 # first party imports
 from analyzing import analyzer
 from filtering import DataCleaner
@@ -30,6 +35,9 @@ logger = logging.getLogger("alertmagnet")
 
 CONFIG: dict[str, str] = {}
 
+# time range in seconds covered by one query of the short-term and the long-term query queue
+QUERY_SEPARATORS = (60 * 60 * 24, 60 * 60 * 24 * 90)
+
 
 def load_config():
     env = os.getenv("ALERTMAGNET_CONFIG_FILE", "-1")
@@ -43,10 +51,14 @@ def load_config():
     CONFIG.update(config.load_config(config_file=config_file))
 
 
+def __terminate(signum, frame):
+    # exit through SystemExit, so atexit handlers like the log queue listener's stop still run
+    sys.exit(0)
+
+
 def setup_logging():
     file = pathlib.Path("config/logging.conf")
-    with open(file=file, mode="r", encoding="utf-8") as f:
-        log_config = json.load(f)
+    log_config = orjson.loads(file.read_bytes())
 
     if CONFIG["log_to_file"]:
         if not os.path.exists("logs"):
@@ -65,6 +77,7 @@ def setup_logging():
     if queue_handler is not None:
         queue_handler.listener.start()
         atexit.register(queue_handler.listener.stop)
+        signal.signal(signal.SIGTERM, __terminate)
 
     logger.info("Logging setup completed.")
 
@@ -81,7 +94,7 @@ def do_analysis(
     max_long_term_storage: str = None,
     **kkwargs  # additional unused keyword arguments for logging purposes
 ):
-    start = dt.now()
+    start = time.perf_counter_ns()
 
     tm = ThreadManager(semaphore_count=cores, delay=delay)
     qm = QueryManager(cert=cert, timeout=timeout, directory_path=directory_path, threshold=threshold, thread_manager=tm)
@@ -92,13 +105,11 @@ def do_analysis(
 
     queries = QuerySplitter.split_by_treshold(QuerySplitter(), query=query, threshold=threshold)
 
-    query_uuids = [qm.add_query_queue() for i in range(len(queries))]
+    query_uuids = [qm.add_query_queue() for _ in queries]
 
-    if not queries[0] is None:
-        qm.create_query_objects(query_queue_uuid=query_uuids[0], query=queries[0], separator=60 * 60 * 24)
-
-    if not queries[1] is None:
-        qm.create_query_objects(query_queue_uuid=query_uuids[1], query=queries[1], separator=60 * 60 * 24 * 90)
+    for index, separator in enumerate(QUERY_SEPARATORS):
+        if queries[index] is not None:
+            qm.create_query_objects(query_queue_uuid=query_uuids[index], query=queries[index], separator=separator)
 
     qm.create_environments()
 
@@ -109,48 +120,43 @@ def do_analysis(
 
     logger.info("Starting to download data.")
     tm.execute_all_threads()
-    end = dt.now()
-    logger.info("Downloading data lastet: %s seconds.", (end - start))
+    qm.close()
+    logger.info("Downloading data lastet: %.3f seconds.", (time.perf_counter_ns() - start) / 1e9)
+
+    start = time.perf_counter_ns()
 
-    start = dt.now()
+    paths = [None] * len(queries)
+    dc = DataCleaner(cores=cores)
 
-    max_index = 2
-    paths = [None for i in range(max_index)]
-    dc = DataCleaner()
+    for index, query_uuid in enumerate(query_uuids):
+        queue = qm.queues[query_uuid]
 
-    for index in range(max_index):
-        query_uuid = query_uuids[index]
+        if len(queue.query_objects) == 0:
+            continue
 
-        if not len(qm.queues[query_uuid].query_objects) == 0:
-            queue = qm.queues[query_uuid]
-            paths[index] = queue.path
+        paths[index] = queue.path
 
-        if not paths[index] is None:
-            try:
-                step = queries[index].kwargs["params"]["step"]
-            except KeyError:
-                step = 60
+        # the request parameters always hold the step, as a string
+        step = float(queries[index].params["step"])
 
-            dc.clear_query_results(path=paths[index], step=step)
+        dc.clear_query_results(path=paths[index], step=step)
 
-    end = dt.now()
-    logger.info("Cleaning data lastet: %s seconds.", (end - start))
+    logger.info("Cleaning data lastet: %.3f seconds.", (time.perf_counter_ns() - start) / 1e9)
 
     logger.info("Starting to analyze data.")
-    start = dt.now()
+    start = time.perf_counter_ns()
 
     for path in paths:
         if path is None:
             continue
         analyzer.get_mean_duration_per_alertname(path=path)
 
-    end = dt.now()
-    logger.info("Analyzing data lastet: %s seconds.", (end - start))
+    logger.info("Analyzing data lastet: %.3f seconds.", (time.perf_counter_ns() - start) / 1e9)
 
     for index_path, path in enumerate(paths[0:1]):
         filtered_data = analyzer.group_alert_timeseries_per_cluster(path=path)
-        start_tt = float(queries[index_path].global_start)
-        end_tt = float(queries[index_path].global_end)
+        start_tt = queries[index_path].global_start
+        end_tt = queries[index_path].global_end
         correlated_data = analyzer.correlate_data(
             path=path,
             result=filtered_data,
@@ -186,10 +192,11 @@ def main(
         kwargs = {}
 
     e = Exporter(prometheus_port=prometheus_port, paths=[])
-    exporter_thread = Thread(target=e.start_server)
+    e.serve()
+    exporter_thread = Thread(target=e.refresh_loop, daemon=True)
     exporter_thread.start()
 
-    to_be_removed_directories = []
+    to_be_removed_directories = deque()
 
     while True:
         start = dt.now(tz=tz.utc)
@@ -208,7 +215,7 @@ def main(
 
         e.paths = paths[0:1]
         e.increase_alertmagnet_analyzing_count()
-        e.update_metrics()
+        e.request_update()
 
         now = dt.now(tz=tz.utc)
 
@@ -218,21 +225,21 @@ def main(
 
         to_be_removed_directories.extend(paths)
 
-        if len(to_be_removed_directories) > 2:
-            for path in to_be_removed_directories[:-2]:
-                if path is None:
-                    continue
+        # keep the results of the latest cycle, remove everything older
+        while len(to_be_removed_directories) > 2:
+            path = to_be_removed_directories.popleft()
 
-                if os.path.exists(path):
-                    for root, dirs, files in os.walk(path, topdown=False):
-                        for name in files:
-                            os.remove(os.path.join(root, name))
-                        for name in dirs:
-                            os.rmdir(os.path.join(root, name))
+            if path is None:
+                continue
 
-                    os.rmdir(path=path)
+            if os.path.exists(path):
+                for root, dirs, files in os.walk(path, topdown=False):
+                    for name in files:
+                        os.remove(os.path.join(root, name))
+                    for name in dirs:
+                        os.rmdir(os.path.join(root, name))
 
-                to_be_removed_directories.remove(path)
+                os.rmdir(path=path)
 
 
 if __name__ == "__main__":
@@ -2,26 +2,82 @@
 This module provides a Prometheus exporter for alert metrics.
 
 Classes:
+    CorrelationCollector: A collector which exposes the correlation coefficients of all alert pairs.
     Exporter: A class to export alert metrics to Prometheus.
 
 Functions:
-    __init__(self, **kwargs): Initializes the Exporter with the given parameters.
-    start_server(self): Starts the Prometheus HTTP server and updates metrics periodically.
+    __init__(self, **kwargs): Initializes the Exporter with the given parameters and an optional registry.
+    serve(self): Starts the Prometheus HTTP server in a background thread.
+    refresh_loop(self): Updates metrics whenever an update is requested.
+    request_update(self): Wakes up the refresh loop to update the metrics.
     update_alertmagnet_important_true_metrics(self): Updates the 'alertmagnet_important_true' metric from JSON files.
     update_alertmagnet_correlation_coefficient_metrics(self): Updates the 'alertmagnet_correlation_coefficient' metric from JSON files.
 """
 
-import json
 import logging
-import os
+import pathlib
+import stat
+import time
 
+from threading import Condition
 
-from prometheus_client import start_http_server
-from prometheus_client.core import Gauge, Counter
+import orjson
+
+from prometheus_client import GCCollector, PlatformCollector, ProcessCollector, start_http_server
+from prometheus_client.core import CollectorRegistry, Counter, Gauge, GaugeMetricFamily
 
 logger = logging.getLogger("alertmagnet")
 
 
+def _create_registry() -> CollectorRegistry:
+    # same process, platform and gc metrics the default registry of prometheus_client exposes
+    registry = CollectorRegistry()
+    ProcessCollector(registry=registry)
+    PlatformCollector(registry=registry)
+    GCCollector(registry=registry)
+
+    return registry
+
+
+class CorrelationCollector(object):
+    """
+    A Prometheus collector which exposes the 'alertmagnet_correlation_coefficient' metric.
+
+    The samples are generated from the stored correlations on each scrape, instead of keeping
+    a labeled Gauge child per alert pair.
+
+    Attributes:
+        correlations (dict): A dictionary mapping each alert to a dictionary of its correlating alerts and their
+                             coefficients. It is replaced as a whole on updates, so a running scrape is not affected.
+
+    Methods:
+        collect():
+            Yields the 'alertmagnet_correlation_coefficient' metric family.
+    """
+
+    def __init__(self):
+        self.correlations = {}
+
+    def collect(self):
+        """
+        Yields the 'alertmagnet_correlation_coefficient' metric family with one sample per alert pair.
+
+        Yields:
+            GaugeMetricFamily: The correlation coefficient metric family.
+        """
+        metric = GaugeMetricFamily(
+            "alertmagnet_correlation_coefficient",
+            "Correlation coefficient of an alert",
+            labels=["alertname", "correlating_alert"],
+        )
+
+        for alert, values in self.correlations.items():
+            for correlating_alert, value in values.items():
+                metric.add_metric([alert, correlating_alert], value)
+
+        yield metric
+
+
 class Exporter(object):
     """
     A class to export Prometheus metrics for alert management.
@@ -29,12 +85,24 @@ class Exporter(object):
     Attributes:
         port (int): The port on which the Prometheus exporter will run.
         paths (list): A list of paths to directories containing alert data files.
-        metrics (dict): A dictionary of Prometheus Gauge metrics.
-        last_changed (dict): A dictionary to track the last modification time of alert data files.
+        files (dict): The alert data files per metric, resolved from `paths` whenever it is assigned.
+        registry (CollectorRegistry): The registry all metrics are registered with and which is served.
+        metrics (dict): A dictionary of Prometheus metrics and collectors.
+        last_changed (dict): A dictionary to track the last modification time (in nanoseconds) of each alert data file
+                             per metric.
+        children (dict): A dictionary of the already labeled Gauge children per metric, keyed by their label values.
+        condition (Condition): The condition the refresh loop waits on until an update is requested.
+        update_requested (bool): Whether an update was requested which the refresh loop has not yet started.
 
     Methods:
-        start_server():
-            Starts the Prometheus exporter server and periodically updates metrics.
+        serve():
+            Starts the Prometheus exporter server in a background thread.
+
+        refresh_loop():
+            Updates metrics whenever an update is requested.
+
+        request_update():
+            Wakes up the refresh loop to update the metrics.
 
         update_alertmagnet_important_true_metrics():
             Updates the 'alertmagnet_important_true' metric based on the data in 'alertMeanDurations.json' files.
@@ -46,49 +114,98 @@ class Exporter(object):
     def __init__(self, **kwargs):
         self.port = kwargs["prometheus_port"]
         self.paths = kwargs["paths"]
+        self.registry = kwargs.get("registry") or _create_registry()
         self.metrics = {
             "alertmagnet_important_true": Gauge(
                 "alertmagnet_important_true",
                 "Indicates whether an alert is important (1) or unimportant (0)",
                 labelnames=["alertname"],
+                registry=self.registry,
             ),
-            "alertmagnet_correlation_coefficient": Gauge(
-                "alertmagnet_correlation_coefficient",
-                "Correlation coefficient of an alert",
-                labelnames=["alertname", "correlating_alert"],
-            ),
+            "alertmagnet_correlation_coefficient": CorrelationCollector(),
             "alertmagnet_analyzing_count": Counter(
                 "alertmagnet_analyzing_count",
                 "Number of alerts being analyzed",
+                registry=self.registry,
             ),
         }
+        self.registry.register(self.metrics["alertmagnet_correlation_coefficient"])
         self.last_changed = {
-            "alertmagnet_important_true": 0,
-            "alertmagnet_correlation_coefficient": 0,
+            "alertmagnet_important_true": {},
+            "alertmagnet_correlation_coefficient": {},
         }
+        self.children = {
+            "alertmagnet_important_true": {},
+        }
+        self.condition = Condition()
+        self.update_requested = False
+
+    @property
+    def paths(self) -> list:
+        """
+        The paths to the directories containing the alert data files.
 
-    def start_server(self):
+        Assigning new paths resolves the alert data files of each metric once, skipping paths which are None.
         """
-        Starts the Prometheus exporter server on the specified port and continuously updates metrics.
+        return self._paths
 
-        This method initializes the Prometheus HTTP server on the port specified by `self.port`.
-        It then enters an infinite loop where it logs the update process, updates specific metrics,
-        and sleeps for 60 seconds before repeating the process.
+    @paths.setter
+    def paths(self, paths: list):
+        self._paths = paths
+
+        directories = [pathlib.Path(path) for path in paths if path is not None]
+        self.files = {
+            "alertmagnet_important_true": [directory / "alertMeanDurations.json" for directory in directories],
+            "alertmagnet_correlation_coefficient": [directory / "correlating_alerts.json" for directory in directories],
+        }
+
+    def serve(self):
+        """
+        Starts the Prometheus exporter server on the specified port.
+
+        The HTTP server runs in a daemon thread started by prometheus_client, so this method returns immediately.
+
+        Returns:
+            None
+        """
+        logger.info("Starting Prometheus exporter on port %s", self.port)
+        start_http_server(self.port, registry=self.registry)
+
+    def refresh_loop(self):
+        """
+        Continuously updates the metrics whenever an update is requested via `request_update`.
 
         Metrics updated:
         - alertmagnet_important_true_metrics
         - alertmagnet_correlation_coefficient_metrics
 
-        Logging:
-        - Logs the start of the Prometheus exporter server.
-        - Logs each update cycle of the metrics.
-
         Note:
-        This method runs indefinitely and should be run in a separate thread or process to avoid blocking.
+        This method runs indefinitely and should be run in a separate daemon thread to avoid blocking.
         """
-        logger.info("Starting Prometheus exporter on port %s", self.port)
-        start_http_server(self.port)
-        self.update_metrics()
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.update_requested)
+                self.update_requested = False
+
+            # a failed update, e.g. on a half written file, must not end the refreshes of this process
+            try:
+                self.update_metrics()
+            except Exception:
+                logger.exception("Updating the metrics failed")
+
+    def request_update(self):
+        """
+        Requests an update of the metrics, e.g. after new analysis results were written to `self.paths`.
+
+        The thread running `refresh_loop` is woken up and updates the metrics immediately.
+        Requests made while an update is running are handled once that update has finished.
+
+        Returns:
+            None
+        """
+        with self.condition:
+            self.update_requested = True
+            self.condition.notify_all()
 
     def update_metrics(self):
         """
@@ -100,33 +217,48 @@ class Exporter(object):
         - update_alertmagnet_correlation_coefficient_metrics: Updates metrics related to correlation coefficients.
         """
         logger.info("Updating metrics")
+        start = time.perf_counter_ns()
         self.update_alertmagnet_important_true_metrics()
         self.update_alertmagnet_correlation_coefficient_metrics()
+        logger.info("Updating metrics took: %.3f seconds.", (time.perf_counter_ns() - start) / 1e9)
 
     def update_alertmagnet_important_true_metrics(self):
         """
         Updates the 'alertmagnet_important_true' metrics by reading the 'alertMeanDurations.json' file
         from each path in self.paths. If the file has been modified since the last update, it reads
-        the JSON data and updates the corresponding metrics.
+        the JSON data, updates the corresponding metrics and stores the file's modification time.
+        Paths without the file or with an unchanged file are skipped.
 
         Returns:
             None
         """
-        for path in self.paths:
-            file = os.path.join(path, "alertMeanDurations.json")
+        for file in self.files["alertmagnet_important_true"]:
+            try:
+                file_stat = file.stat()
+            except FileNotFoundError:
+                continue
+
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+
+            last_changed = file_stat.st_mtime_ns
 
-            if not os.path.isfile(path=file):
-                return
+            if last_changed == self.last_changed["alertmagnet_important_true"].get(file):
+                continue
 
-            if os.path.getmtime(file) == self.last_changed["alertmagnet_important_true"]:
-                return
+            with file.open(mode="rb") as f:
+                data = orjson.loads(f.read())
 
-            with open(file=file, mode="r", encoding="utf-8") as f:
-                data = json.load(f)
+            g = self.metrics["alertmagnet_important_true"]
+            children = self.children["alertmagnet_important_true"]
 
             for alert, value in data.items():
-                g = self.metrics["alertmagnet_important_true"]
-                g.labels(alertname=alert).set(value)
+                child = children.get(alert)
+                if child is None:
+                    child = children[alert] = g.labels(alertname=alert)
+                child.set(value)
+
+            self.last_changed["alertmagnet_important_true"][file] = last_changed
 
     def update_alertmagnet_correlation_coefficient_metrics(self):
         """
@@ -137,33 +269,39 @@ class Exporter(object):
         the file has been modified since the last update.
 
         The method performs the following steps:
-        1. Constructs the file path for "correlating_alerts.json".
-        2. Checks if the file exists. If not, the method returns.
-        3. Compares the file's last modification time with the stored last change time for
-           "alertmagnet_correlation_coefficient". If they are the same, the method returns early.
+        1. Takes the file path for "correlating_alerts.json" resolved when `self.paths` was assigned.
+        2. Checks if the file exists. If not, the path is skipped.
+        3. Compares the file's last modification time with the stored last change time of this file.
+           If they are the same, the path is skipped.
         4. Opens and reads the JSON data from the file.
         5. Iterates through the alerts and their corresponding correlation values.
-        6. Updates the metrics for each alert and its correlating alerts using the provided values.
+        6. Replaces the correlations of these alerts in the correlation collector.
+        7. Stores the file's modification time, so an unchanged file is not read again.
 
         Returns:
             None
         """
-        for path in self.paths:
-            file = os.path.join(path, "correlating_alerts.json")
+        for file in self.files["alertmagnet_correlation_coefficient"]:
+            try:
+                file_stat = file.stat()
+            except FileNotFoundError:
+                continue
+
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+
+            last_changed = file_stat.st_mtime_ns
 
-            if not os.path.isfile(path=file):
-                return
+            if last_changed == self.last_changed["alertmagnet_correlation_coefficient"].get(file):
+                continue
 
-            if os.path.getmtime(file) == self.last_changed["alertmagnet_correlation_coefficient"]:
-                return
+            with file.open(mode="rb") as f:
+                data = orjson.loads(f.read())
 
-            with open(file=file, mode="r", encoding="utf-8") as f:
-                data = json.load(f)
+            collector = self.metrics["alertmagnet_correlation_coefficient"]
+            collector.correlations = {**collector.correlations, **data}
 
-            for alert, values in data.items():
-                for correlating_alert, value in values.items():
-                    g = self.metrics["alertmagnet_correlation_coefficient"]
-                    g.labels(alertname=alert, correlating_alert=correlating_alert).set(value)
+            self.last_changed["alertmagnet_correlation_coefficient"][file] = last_changed
 
     def increase_alertmagnet_analyzing_count(self):
         """
@@ -29,11 +29,13 @@ Usage:
     This module is intended to be used for managing and executing large sets of queries, particularly in environments where queries need to be split and executed in parallel. It handles the complexities of query execution, result handling, and error management.
 
 Dependencies:
-    - copy
-    - json
     - os
+    - random
+    - time
     - uuid
+    - collections.deque
     - datetime
+    - orjson
     - requests
     - utilities.Calc
     - utilities.errors
@@ -45,18 +47,22 @@ Dependencies:
 
 from __future__ import annotations
 
-import copy
-import json
 import logging
 import os
+import random
+import time
 import uuid
 
+from collections import deque
 from datetime import datetime as dt
 from datetime import timedelta as td
 from datetime import timezone as tz
 
+import orjson
 import requests
 
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
 from filtering import data_filter
 from utilities import Calc
 from utilities import errors
@@ -68,6 +74,28 @@ logger = logging.getLogger("alertmagnet")
 
 calc = Calc()
 
+# request parameters of every query; start and end are set per query
+DEFAULT_QUERY_PARAMETERS = {
+    "query": "ALERTS",
+    "dedup": "true",
+    "partial_response": "false",
+    "start": None,
+    "end": None,
+    "step": "60",
+    "max_source_resolution": "0s",
+    "engine": "thanos",
+    "analyze": "false",
+}
+
+# request parameters which may be overwritten through the query's kwargs
+VALID_QUERY_PARAMETERS = frozenset(
+    ("query", "dedup", "partial_response", "step", "max_source_resolution", "engine", "analyze")
+)
+
+# number of attempts per request and the longest wait in seconds before retrying a rate limited request
+REQUEST_ATTEMPTS = 3
+RETRY_BACKOFF_MAX = 60
+
 
 class QueryExecutor:
     """
@@ -75,81 +103,99 @@ class QueryExecutor:
 
     Attributes:
         path (str): The file path where query results will be saved.
+        session (requests.Session): The session used to send the requests, if any.
+        rate_limiter (semaphore.RateLimiter): The limiter every request has to pass before it is sent, if any.
         query (Query): The current query being executed.
+        pending (deque[Query]): The queries waiting to be executed, e.g. the halves of a split query.
         chunk (int): The chunk number for splitting query results.
 
     Methods:
-        __init__(path: str):
-            Initializes the QueryExecutor with a given file path.
+        __init__(path: str, session: requests.Session = None, rate_limiter: semaphore.RateLimiter = None):
+            Initializes the QueryExecutor with a given file path, an optional session and an optional rate limiter.
 
         execute_query(query: Query):
-            Executes a given query and handles the result.
+            Executes a given query and all queries split from it and handles the results.
 
         reset():
-            Resets the query and chunk attributes to their initial state.
+            Resets the query, pending and chunk attributes to their initial state.
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, session: requests.Session = None, rate_limiter: semaphore.RateLimiter = None):
         self.query = None
         self.path = path
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.pending: deque[Query] = deque()
         self.chunk = 0
 
     def execute_query(self, query: Query):
         """
         Executes the given query and handles the result.
 
+        If the result exceeds the maximum, the query is split in half and both halves are executed
+        in order before this method returns.
+
         Args:
             query (Query): The query object to be executed.
 
         Returns:
             None
         """
-        self.query = query
-        result = query.execute()
-        self.__handle_query_result(result=result)
+        self.pending.append(query)
+
+        while self.pending:
+            self.query = self.pending.popleft()
+            result = self.query.execute(session=self.session, rate_limiter=self.rate_limiter)
+            self.__handle_query_result(result=result)
 
     def reset(self):
         """
-        Resets the query and chunk attributes to their initial states.
+        Resets the query, pending and chunk attributes to their initial states.
 
-        This method sets the `query` attribute to None and the `chunk` attribute to 0.
+        This method sets the `query` attribute to None, empties `pending` and sets the `chunk` attribute to 0.
         """
         self.query = None
+        self.pending.clear()
         self.chunk = 0
 
     def __handle_query_result(self, result: dict):
         if result["status"] == "success":
-            for index, value in enumerate(result["data"]["result"]):
-                value["values"] = data_filter.remove_state_from_timestamp_value(value["values"])
-                result["data"]["result"][index] = value
+            for series in result["data"]["result"]:
+                series["values"] = data_filter.remove_state_from_timestamp_value(series["values"])
 
             filename = os.path.join(self.path, f"data{self.chunk}.json")
 
-            with open(file=filename, mode="w", encoding="utf-8") as f:
-                f.write(json.dumps(result))
-        elif result == response_messages.MESSAGE_EXCEEDED_MAXIMUM:
-            query1, query2 = self.__split_request_by_half(self.query)
+            with open(file=filename, mode="wb") as f:
+                f.write(orjson.dumps(result))
 
-            self.execute_query(query=query1)
-            self.chunk += 1
-            self.execute_query(query=query2)
             self.chunk += 1
+        elif result == response_messages.MESSAGE_EXCEEDED_MAXIMUM:
+            # a window shorter than one step holds a single sample and cannot be split on the sample grid
+            if self.query.global_end - self.query.global_start < float(self.query.params["step"]):
+                logger.warning(
+                    "Dropping query from %s to %s, it exceeds the maximum and can't be split any further",
+                    self.query.params["start"],
+                    self.query.params["end"],
+                )
+                return
+
+            # both halves run before any other pending query, in the same order as the former recursive calls
+            query1, query2 = self.__split_request_by_half(self.query)
+            self.pending.extendleft(query for query in (query2, query1) if query.global_start <= query.global_end)
 
         return
 
     def __split_request_by_half(self, query: Query) -> tuple[Query, Query]:
-        start_tt = float(query.global_start)
-        end_tt = float(query.global_end)
-
-        time_difference = end_tt - start_tt
-        half = time_difference / 2
-        mid = end_tt - half
+        # the midpoint is snapped to the sample grid of the query and the later half starts one step after it, so
+        # both halves return samples on the same timestamps as the whole query and none of them twice
+        step = float(query.params["step"])
+        mid = query.global_start + step * ((query.global_end - query.global_start) // (2 * step))
 
-        query1 = copy.deepcopy(query)
-        query2 = copy.deepcopy(query)
+        query1 = query.clone()
+        query2 = query.clone()
 
-        query1.global_start = mid
-        query2.global_end = mid
+        query1.set_start(start=mid + step)
+        query2.set_end(end=mid)
 
         return (query1, query2)
 
@@ -160,8 +206,8 @@ class Query(object):
 
     Attributes:
         base_url (str): The base URL for the query.
-        global_start (str): The start time for the query.
-        global_end (str): The end time for the query.
+        global_start (float): The start time for the query as a unix timestamp.
+        global_end (float): The end time for the query as a unix timestamp.
         kwargs (dict): Additional keyword arguments for the query.
         path (str): The path for the query.
         cert (str): The certificate for the query.
@@ -172,28 +218,31 @@ class Query(object):
     Methods:
         initialize():
             Initializes the query parameters.
-        execute():
+        execute(session: requests.Session = None, rate_limiter: semaphore.RateLimiter = None):
             Executes the query and returns the result.
         set_request_parameters(cert: str = None, timeout: int = None):
             Sets the request parameters for the query.
-        set_start(start: str):
+        set_start(start: float):
             Sets the start time for the query.
-        set_end(end: str):
+        set_end(end: float):
             Sets the end time for the query.
+        clone() -> Query:
+            Returns an independent copy of the query.
     """
 
     def __init__(
         self,
         base_url: str = None,
-        start: str = None,
-        end: str = None,
+        start: float | str = None,
+        end: float | str = None,
         kwargs: dict = None,
-    ):  # TODO set standard format for start / end -> str | float
+    ):
         self.path = None
 
+        # timestamps are kept as floats and only formatted for the request parameters
         self.base_url = base_url
-        self.global_start = start
-        self.global_end = end
+        self.global_start = None if start is None else float(start)
+        self.global_end = None if end is None else float(end)
 
         # maybe apply kwargs as kwargs
         self.kwargs = {} if kwargs is None else kwargs
@@ -212,20 +261,21 @@ class Query(object):
         This method ensures that the `global_end` and `global_start` attributes have valid values.
         If `global_end` is None, it sets it to the current timestamp.
         If `global_start` is None, it calculates the timestamp for five years ago and sets it.
+        The current time is only read if one of them is missing.
         Finally, it applies additional request data through the `__parse_request_data` method.
         """
-        now = dt.now(tz.utc)
+        if self.global_end is None or self.global_start is None:
+            now = dt.now(tz.utc)
 
-        self.global_end = str(now.timestamp()) if self.global_end is None else self.global_end  # ensures end has value
+            self.global_end = now.timestamp() if self.global_end is None else self.global_end  # ensures end has value
 
-        if self.global_start is None:  # ensures start has value
-            self.global_start = calc.calculate_max_past(now, calc.max_long_term)
-            self.global_start = str(self.global_start)
+            if self.global_start is None:  # ensures start has value
+                self.global_start = calc.calculate_max_past(now, calc.max_long_term)
 
         # apply kwargs values
         self.__parse_request_data()
 
-    def execute(self):
+    def execute(self, session: requests.Session = None, rate_limiter: semaphore.RateLimiter = None):
         """
         Executes a request and parses the result.
 
@@ -233,10 +283,16 @@ class Query(object):
         then parses the response using the __parse_request_result method,
         and returns the parsed result.
 
+        Args:
+            session (requests.Session, optional): The session used to send the request. Without a session
+                                                  a new connection is opened for the request. Defaults to None.
+            rate_limiter (semaphore.RateLimiter, optional): The limiter every attempt of the request has to pass
+                                                            before it is sent. Defaults to None.
+
         Returns:
             The parsed result of the request.
         """
-        response = self.__execute_request()
+        response = self.__execute_request(session=session, rate_limiter=rate_limiter)
         result = self.__parse_request_result(response=response)
 
         return result
@@ -252,13 +308,29 @@ class Query(object):
         self.cert = cert
         self.timeout = timeout
 
+    def clone(self) -> Query:
+        """
+        Creates an independent copy of the query without initializing it again.
+
+        Only the dictionaries are copied; all other attributes are immutable and shared with the copy.
+
+        Returns:
+            Query: The copy of the query.
+        """
+        query = Query.__new__(Query)
+        query.__dict__.update(self.__dict__)
+        query.kwargs = {key: value.copy() if isinstance(value, dict) else value for key, value in self.kwargs.items()}
+        query.params = None if self.params is None else self.params.copy()
+
+        return query
+
     # TODO set property
-    def set_start(self, start: str):
+    def set_start(self, start: float):
         """
         Sets the start parameter for the query.
 
         Args:
-            start (str): The start time or date to be set.
+            start (float): The start time as a unix timestamp.
 
         Returns:
             None
@@ -268,15 +340,15 @@ class Query(object):
         if self.params is None:
             return
 
-        self.params["start"] = start
+        self.params["start"] = str(start)
 
     # TODO set property
-    def set_end(self, end: str):
+    def set_end(self, end: float):
         """
         Sets the end parameter for the query.
 
         Args:
-            end (str): The end time or date to set for the query.
+            end (float): The end time as a unix timestamp.
 
         Returns:
             None
@@ -286,9 +358,11 @@ class Query(object):
         if self.params is None:
             return
 
-        self.params["end"] = end
+        self.params["end"] = str(end)
 
-    def __execute_request(self) -> requests.Response:
+    def __execute_request(
+        self, session: requests.Session = None, rate_limiter: semaphore.RateLimiter = None
+    ) -> requests.Response:
         base_url = self.base_url
         cert = self.cert
         params = self.params
@@ -296,10 +370,14 @@ class Query(object):
         timeout = self.timeout
 
         url = base_url + target
+        get = requests.get if session is None else session.get
+
+        for attempt in range(REQUEST_ATTEMPTS):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
 
-        for _ in range(3):
             try:
-                res = requests.get(url=url, cert=cert, params=params, timeout=timeout)
+                res = get(url=url, cert=cert, params=params, timeout=timeout)
             except requests.ConnectTimeout as e:
                 logger.warning("requests.ConnectTimeout: %s", e)
                 continue
@@ -319,9 +397,23 @@ class Query(object):
                 logger.error("Exception occured: %s", e)
                 raise e
             else:
+                if res.status_code == 429:  # the endpoint asks to back off, in seconds if a number is given
+                    if attempt == REQUEST_ATTEMPTS - 1:
+                        break
+
+                    retry_after = res.headers.get("Retry-After", "")
+                    backoff = int(retry_after) if retry_after.isdigit() else 2**attempt
+                    # the jitter keeps the waiting threads from retrying at the same time
+                    backoff = min(backoff * random.uniform(1, 1.5), RETRY_BACKOFF_MAX)
+                    logger.warning("Too many requests, retrying in %.1f seconds", backoff)
+                    time.sleep(backoff)
+                    continue
+
                 return res
 
-        logger.debug("safety catch invoked")
+        logger.warning(
+            "Dropping query from %s to %s after %d failed attempts", params["start"], params["end"], REQUEST_ATTEMPTS
+        )
         return ResponseDummy(response_messages.EMPTY_RESULTS)
 
     def __parse_request_result(self, response: requests.Response):
@@ -329,9 +421,9 @@ class Query(object):
             return response_messages.EMPTY_RESULTS
 
         try:
-            data = response.json()
-        except requests.exceptions.JSONDecodeError:
-            logging.error("JSONDecodeError: %s", response.text)
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            logger.error("JSONDecodeError: %s", response.text)
             return response_messages.EMPTY_RESULTS
         except Exception as e:
             logger.warning("Exception occured: %s, %s", e.args, e.__traceback__.__str__)
@@ -346,40 +438,19 @@ class Query(object):
             return data
 
     def __parse_request_data(self):
-        start = self.global_start
-        end = self.global_end
-
-        valid_query_parameters = (
-            "query",
-            "dedup",
-            "partial_response",
-            "step",
-            "max_source_resolution",
-            "engine",
-            "analyze",
-        )
-
         if "target" in self.kwargs:
             target = self.kwargs["target"]
         else:
             target = "query_range"
 
-        params = {
-            "query": "ALERTS",
-            "dedup": "true",
-            "partial_response": "false",
-            "start": start,
-            "end": end,
-            "step": "60",
-            "max_source_resolution": "0s",
-            "engine": "thanos",
-            "analyze": "false",
-        }
+        params = DEFAULT_QUERY_PARAMETERS.copy()
+        params["start"] = str(self.global_start)
+        params["end"] = str(self.global_end)
 
         if "params" in self.kwargs:  # TODO consider using filters
-            for parameter_key in self.kwargs["params"].keys():
-                if parameter_key in valid_query_parameters:
-                    params[parameter_key] = self.kwargs["params"][parameter_key]
+            for parameter_key, parameter_value in self.kwargs["params"].items():
+                if parameter_key in VALID_QUERY_PARAMETERS:
+                    params[parameter_key] = parameter_value
 
         self.params = params
         self.target = target
@@ -395,6 +466,8 @@ class QueryManager:
         directory_path (str): Path to store query data.
         threshold (int): Threshold value for query processing.
         thread_manager (semaphore.ThreadManager): Manager for handling threads.
+        session (requests.Session): Session shared by all queries to keep the connections to the endpoint alive.
+        rate_limiter (semaphore.RateLimiter): Limiter of the thread manager spacing out the requests of all queries.
         queues (dict[str, QueryQueue]): Dictionary of query queues managed by this instance.
 
     Methods:
@@ -406,6 +479,9 @@ class QueryManager:
 
         create_environments():
             Creates environments for all query queues with query objects.
+
+        close():
+            Closes the connections of the shared session.
     """
 
     def __init__(
@@ -421,6 +497,16 @@ class QueryManager:
         self.treshold = threshold
         self.thread_manager = thread_manager
 
+        # one connection per concurrently running query, reused by all following queries
+        pool_size = DEFAULT_POOLSIZE if thread_manager is None else thread_manager.semaphore_count
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # requests are spaced out by the thread manager's delay instead of the thread starts
+        self.rate_limiter = None if thread_manager is None else thread_manager.rate_limiter
+
         self.queues: dict[str, QueryQueue] = {}
         self.directory_path = "data" if directory_path is None else directory_path
 
@@ -461,9 +547,9 @@ class QueryManager:
                 f"The provided QueryQueue object doesn't exist inside this QueryManager.\nquery_queue_uuid: {query_queue_uuid}"
             )
 
-        for key, value in query_objects.items():
-            query_object = QueryObject(query_queue=query_queue, query=value, nr=key)
-            query_queue.add_query_object(query_object=query_object)
+        query_queue.query_objects.extend(
+            QueryObject(query_queue=query_queue, query=value, nr=key) for key, value in enumerate(query_objects)
+        )
 
     def create_environments(self):
         """
@@ -481,6 +567,15 @@ class QueryManager:
                 continue
             queue.create_query_queue_environemt(self.directory_path)
 
+    def close(self):
+        """
+        Closes all connections kept open by the shared session.
+
+        Returns:
+            None
+        """
+        self.session.close()
+
 
 # TODO add visual feedback
 
@@ -521,11 +616,13 @@ class QueryObject(object):
         Raises:
             OSError: If the directory creation fails.
         """
-        if not os.path.exists(path=path):
-            os.makedirs(name=path)
-
         self.path = os.path.join(path, f"group{self.object_nr}")
-        os.mkdir(self.path)
+
+        # the query queue creates the base directory beforehand, so it rarely has to be created here
+        try:
+            os.mkdir(self.path)
+        except FileNotFoundError:
+            os.makedirs(name=self.path)
 
     def execute_query(self):
         """
@@ -533,7 +630,7 @@ class QueryObject(object):
 
         This method retrieves the certificate and timeout from the query manager,
         sets the request parameters for the query, and then executes the query
-        using a QueryExecutor instance.
+        using a QueryExecutor instance with the query manager's session and rate limiter.
 
         Attributes:
             cert (str): The certificate used for the query.
@@ -545,9 +642,11 @@ class QueryObject(object):
         """
         cert = self.query_queue.query_manager.cert
         path = self.path
+        session = self.query_queue.query_manager.session
+        rate_limiter = self.query_queue.query_manager.rate_limiter
         timeout = self.query_queue.query_manager.timeout
         self.query.set_request_parameters(cert=cert, timeout=timeout)
-        qe = QueryExecutor(path=path)
+        qe = QueryExecutor(path=path, session=session, rate_limiter=rate_limiter)
         qe.execute_query(self.query)
 
 
@@ -567,8 +666,8 @@ class QueryQueue(object):
         add_query_object(query_object: QueryObject):
             Adds a query object to the queue.
 
-        schedule_queries() -> list[str]:
-            Schedules the execution of all query objects in the queue and returns a list of thread UUIDs.
+        schedule_queries() -> list[int]:
+            Schedules the execution of all query objects in the queue and returns a list of thread ids.
     """
 
     def __init__(self, query_manager: QueryManager):
@@ -581,23 +680,19 @@ class QueryQueue(object):
         Creates a query queue environment at the specified path.
 
         This method performs the following steps:
-        1. Checks if the specified path exists. If not, it creates the directory.
-        2. Generates a unique identifier (UUID) for the query queue.
-        3. Constructs the full path for the query queue using the base path and the UUID.
-        4. Creates the directory for the query queue.
-        5. Iterates over the query objects and calls their `create_query_object_environment` method to set up their environments.
+        1. Generates a unique identifier (UUID) for the query queue.
+        2. Constructs the full path for the query queue using the base path and the UUID.
+        3. Creates the directory for the query queue together with any missing parent directories.
+        4. Iterates over the query objects and calls their `create_query_object_environment` method to set up their environments.
 
         Args:
             path (str): The base directory path where the query queue environment will be created.
         """
-        if not os.path.exists(path=path):
-            os.makedirs(name=path)
-
         queue_uuid = uuid.uuid4().hex
 
         self.path = os.path.join(path, queue_uuid)
 
-        os.mkdir(self.path)
+        os.makedirs(name=self.path)
 
         for query_object in self.query_objects:
             query_object.create_query_object_environment(self.path)
@@ -611,18 +706,18 @@ class QueryQueue(object):
         """
         self.query_objects.append(query_object)
 
-    def schedule_queries(self) -> list[str]:
+    def schedule_queries(self) -> list[int]:
         """
         Schedules the execution of queries by creating a new thread for each query object.
 
         Returns:
-            list[str]: A list of thread UUIDs corresponding to the scheduled queries.
+            list[int]: A list of thread ids corresponding to the scheduled queries.
         """
         out = []
 
         for query_object in self.query_objects:
-            thread_uuid = self.query_manager.thread_manager.add_thread(query_object.execute_query)
-            out.append(thread_uuid)
+            thread_id = self.query_manager.thread_manager.add_thread(query_object.execute_query)
+            out.append(thread_id)
 
         return out
 
@@ -636,7 +731,7 @@ class QuerySplitter(object):
     split_by_treshold(query: Query, threshold: int = None) -> list[Query | None, Query | None]:
         Splits a query into two parts based on a given threshold in days. If no threshold is provided, returns the original query and None.
 
-    split_by_separator(query: Query, separator: int):
+    split_by_separator(query: Query, separator: int) -> list[Query]:
         Splits a query into multiple parts based on a given time separator in seconds.
     """
 
@@ -671,17 +766,12 @@ class QuerySplitter(object):
 
         if start is None:
             start = calc.calculate_max_past(now, calc.max_long_term)
-            start = str(start)
-
-        end = str(now.timestamp()) if end is None else end
 
-        split = str((now - td(days=threshold)).timestamp())
+        end = now.timestamp() if end is None else end
 
-        flt_start = float(start)
-        flt_split = float(split)
-        flt_end = float(end)
+        split = (now - td(days=threshold)).timestamp()
 
-        if flt_end > flt_split > flt_start:
+        if end > split > start:
             queries.append(Query(base_url=base_url, start=split, end=end, kwargs=kwargs))
 
             params = {
@@ -689,11 +779,7 @@ class QuerySplitter(object):
                 "max_source_resolution": "1h",
             }  # for 2nd query
 
-            kwargs = copy.deepcopy(kwargs)
-            if "params" in kwargs.keys():
-                kwargs["params"].update(params)
-            else:
-                kwargs["params"] = params
+            kwargs = {**kwargs, "params": {**kwargs.get("params", {}), **params}}
 
             queries.append(Query(base_url=base_url, start=start, end=split, kwargs=kwargs))
         else:
@@ -706,7 +792,7 @@ class QuerySplitter(object):
 
         return queries
 
-    def split_by_separator(self, query: Query, separator: int):
+    def split_by_separator(self, query: Query, separator: int) -> list[Query]:
         """
         Splits a given query into multiple sub-queries based on a specified time separator.
 
@@ -715,36 +801,38 @@ class QuerySplitter(object):
             separator (int): The time interval in seconds to split the query by.
 
         Returns:
-            dict: A dictionary where the keys are integers representing the sub-query index,
-                  and the values are the sub-query objects.
+            list[Query]: The sub-query objects in chronological order.
         """
-        query_objects = {}
+        query_objects = []
 
-        start = dt.fromtimestamp(float(query.global_start))
-        global_end = dt.fromtimestamp(float(query.global_end))
-        step = td(seconds=separator)
-        objects_counter = 0
+        start = query.global_start
+        global_end = query.global_end
+
+        # the range endpoints are evaluated inclusively, so each sub-query starts one sample step after the end of
+        # the previous one; with the separator being a multiple of the step, all sub-queries share the sample grid
+        # of the whole query and no sample is requested twice
+        sample_step = float(query.params["step"])
+        step = max(separator - separator % sample_step, sample_step)
 
         end = start + step
         while end < global_end:
             query_copy = self.__create_query_copy(query=query, start=start, end=end)
-            query_objects[objects_counter] = query_copy
+            query_objects.append(query_copy)
 
-            start = end
-            end = start + step
-            objects_counter += 1
+            start = end + sample_step
+            end = end + step
 
-        diff = global_end - end
-        end = end + diff
+        end = global_end
 
-        query_copy = self.__create_query_copy(query=query, start=start, end=end)
-        query_objects[objects_counter] = query_copy
+        if start <= end:  # otherwise the previous sub-query already contains the last sample
+            query_copy = self.__create_query_copy(query=query, start=start, end=end)
+            query_objects.append(query_copy)
 
         return query_objects
 
-    def __create_query_copy(self, query: Query, start: dt, end: dt) -> Query:
-        query_copy = copy.deepcopy(query)
-        query_copy.set_start(start=start.timestamp())
-        query_copy.set_end(end=end.timestamp())
+    def __create_query_copy(self, query: Query, start: float, end: float) -> Query:
+        query_copy = query.clone()
+        query_copy.set_start(start=start)
+        query_copy.set_end(end=end)
 
         return query_copy
@@ -6,7 +6,8 @@ setup(
     packages=find_packages(),
     py_modules=["main"],
     install_requires=[
-        "pandas",
+        "numpy",
+        "orjson",
         "prometheus-client",
         "requests",
     ],
@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+import unittest
+
+from analyzing import filtering
+
+
+class TestAnalyzingFilter(unittest.TestCase):
+    def test_filtering_groups_values_per_cluster_and_alertname(self):
+        data = [
+            {
+                "metric": {"alertname": "A", "cluster": "c1", "alertstate": "firing", "severity": "info"},
+                "values": [[0, 60]],
+            },
+            {
+                "metric": {"alertname": "A", "cluster": "c1", "alertstate": "firing", "severity": "warning"},
+                "values": [[300, 0]],
+            },
+            {
+                "metric": {"alertname": "A", "cluster": "c1", "alertstate": "pending", "severity": "info"},
+                "values": [[0, 0]],
+            },
+            {
+                "metric": {"alertname": "B", "cluster": "c2", "alertstate": "firing", "severity": "info"},
+                "values": [[60, 120]],
+            },
+        ]
+
+        expected_result = {"c1": {"A": [[0, 60], [300, 0]]}, "c2": {"B": [[60, 120]]}}
+
+        with tempfile.TemporaryDirectory() as path:
+            with open(file=os.path.join(path, "finalData.json"), mode="w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+            result = filtering(path=path)
+
+            with open(file=os.path.join(path, "filteredData.json"), mode="r", encoding="utf-8") as f:
+                written_result = json.load(f)
+
+        self.assertEqual(result, expected_result)
+        self.assertEqual(written_result, expected_result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,8 +40,16 @@ class TestCalc(TestCase):
 
         self.assertEqual(result, expected_result)
 
-    def test_parse_past_range_invalid(self):
-        expected_result = td()
-        result = self.calc._Calc__parse_past_range("invalid")  # pylint: disable=W0212
+    def test_parse_past_range_combined(self):
+        expected_result = td(days=365 + 2 * 28 + 7 + 3)
+        result = self.calc._Calc__parse_past_range("1y2m1w3d")  # pylint: disable=W0212
 
         self.assertEqual(result, expected_result)
+
+    def test_parse_past_range_invalid(self):
+        with self.assertRaises(ValueError):
+            self.calc._Calc__parse_past_range("invalid")  # pylint: disable=W0212
+
+    def test_parse_past_range_trailing_garbage(self):
+        with self.assertRaises(ValueError):
+            self.calc._Calc__parse_past_range("5dx")  # pylint: disable=W0212
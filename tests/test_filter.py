@@ -79,6 +79,16 @@ class TestFilter(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
+    def test_create_time_ranges_with_trailing_double_input(self):
+        data = [0, 5, 10, 10]
+        step = 5
+
+        expected_result = [(0, 10)]
+
+        result = create_time_ranges(data=data, step=step)
+
+        self.assertEqual(result, expected_result)
+
     def test_create_time_ranges_with_one_input(self):
         data = [77]
         step = 5
@@ -89,6 +99,27 @@ class TestFilter(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
+    def test_create_time_ranges_with_long_input(self):
+        data = [float(value) for value in range(0, 50000, 5) if value not in (20000, 20005)] + [50000.0, 50100.0]
+        step = 5
+
+        expected_result = [(0.0, 19995.0), (20010.0, 29990.0), (50100.0, 0.0)]
+
+        result = create_time_ranges(data=data, step=step)
+
+        self.assertEqual(result, expected_result)
+
+    def test_create_time_ranges_with_long_int_input(self):
+        data = list(range(0, 20000, 5)) + list(range(30000, 40000, 5))
+        step = 5
+
+        expected_result = [(0, 19995), (30000, 9995)]
+
+        result = create_time_ranges(data=data, step=step)
+
+        self.assertEqual(result, expected_result)
+        self.assertTrue(all(type(value) is int for time_range in result for value in time_range))
+
     def test_create_time_ranges_with_wrong_input(self):
         data = "ABAP"
         step = 5
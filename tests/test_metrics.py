@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+
+from threading import Event, Thread
+from unittest import mock
+
+from prometheus_client import generate_latest
+
+from presenting.metrics import Exporter
+
+
+class TestExporter(unittest.TestCase):
+    def test_update_metrics_exposes_alert_data(self):
+        with tempfile.TemporaryDirectory() as path:
+            with open(file=os.path.join(path, "alertMeanDurations.json"), mode="w", encoding="utf-8") as f:
+                json.dump({"A": 1, "B": 0}, f)
+
+            with open(file=os.path.join(path, "correlating_alerts.json"), mode="w", encoding="utf-8") as f:
+                json.dump({"A": {"B": 0.5}, "B": {"A": 0.5}}, f)
+
+            e = Exporter(prometheus_port=0, paths=[path])
+            e.update_metrics()
+
+        output = generate_latest(e.registry).decode()
+
+        self.assertIn('alertmagnet_important_true{alertname="A"} 1.0', output)
+        self.assertIn('alertmagnet_important_true{alertname="B"} 0.0', output)
+        self.assertIn('alertmagnet_correlation_coefficient{alertname="A",correlating_alert="B"} 0.5', output)
+        self.assertIn('alertmagnet_correlation_coefficient{alertname="B",correlating_alert="A"} 0.5', output)
+
+    def test_update_metrics_skips_paths_without_data(self):
+        with tempfile.TemporaryDirectory() as empty_path, tempfile.TemporaryDirectory() as path:
+            with open(file=os.path.join(path, "alertMeanDurations.json"), mode="w", encoding="utf-8") as f:
+                json.dump({"A": 1}, f)
+
+            with open(file=os.path.join(path, "correlating_alerts.json"), mode="w", encoding="utf-8") as f:
+                json.dump({"A": {"B": 0.5}}, f)
+
+            e = Exporter(prometheus_port=0, paths=[empty_path, path])
+            e.update_metrics()
+
+        self.assertEqual(e.registry.get_sample_value("alertmagnet_important_true", {"alertname": "A"}), 1.0)
+        self.assertEqual(
+            e.registry.get_sample_value(
+                "alertmagnet_correlation_coefficient", {"alertname": "A", "correlating_alert": "B"}
+            ),
+            0.5,
+        )
+
+    def test_exporters_use_separate_registries(self):
+        e1 = Exporter(prometheus_port=0, paths=[])
+        e2 = Exporter(prometheus_port=0, paths=[])
+
+        e1.increase_alertmagnet_analyzing_count()
+
+        self.assertIsNot(e1.registry, e2.registry)
+        self.assertEqual(e1.registry.get_sample_value("alertmagnet_analyzing_count_total"), 1.0)
+        self.assertEqual(e2.registry.get_sample_value("alertmagnet_analyzing_count_total"), 0.0)
+
+    def test_refresh_loop_survives_failed_update(self):
+        e = Exporter(prometheus_port=0, paths=[])
+        calls = []
+        failed = Event()
+        served = Event()
+
+        def update_metrics():
+            calls.append(len(calls))
+
+            if len(calls) == 1:
+                failed.set()
+                raise OSError("failed update")
+
+            served.set()
+
+        with mock.patch.object(e, "update_metrics", update_metrics), self.assertLogs("alertmagnet", level="ERROR"):
+            Thread(target=e.refresh_loop, daemon=True).start()
+            e.request_update()
+            self.assertTrue(failed.wait(5))
+
+            e.request_update()
+
+            self.assertTrue(served.wait(5))
+
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
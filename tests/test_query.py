@@ -1,9 +1,15 @@
+import os
+import tempfile
 import unittest
 
 from datetime import datetime as dt
 from datetime import timedelta as td
+from unittest import mock
 
 from querying import Query
+from querying import QueryExecutor
+from querying import QuerySplitter
+from querying import response_messages
 
 API_ENDPOINT = "https://metrics-internal.qa-de-1.cloud.sap/api/v1/"
 
@@ -36,6 +42,80 @@ class TestQuery(unittest.TestCase):
         self.assertEqual(query.params, params)
         self.assertEqual(query.target, target)
 
+    def test_query_set_start_end(self):
+        now = dt.now()
+        start = (now - td(hours=5)).timestamp()
+        end = now.timestamp()
+
+        query = Query(base_url=API_ENDPOINT, start=str(start), end=str(end))
+        query.set_start(start=start + 60)
+        query.set_end(end=end - 60)
+
+        self.assertEqual(query.global_start, start + 60)
+        self.assertEqual(query.global_end, end - 60)
+        self.assertEqual(query.params["start"], str(start + 60))
+        self.assertEqual(query.params["end"], str(end - 60))
+
+    def test_split_by_separator(self):
+        start = 1700000000.0
+        end = start + 60 * 60 * 24 * 3 + 90
+
+        query = Query(base_url=API_ENDPOINT, start=start, end=end)
+        queries = QuerySplitter().split_by_separator(query=query, separator=60 * 60 * 24)
+
+        self.assertEqual(len(queries), 4)
+        self.assertEqual(queries[0].global_start, start)
+        self.assertEqual(queries[-1].global_end, end)
+
+        for previous, following in zip(queries, queries[1:]):
+            self.assertEqual(following.global_start, previous.global_end + 60)
+            self.assertEqual((following.global_start - start) % 60, 0)
+
+    def test_execute_query_stops_splitting(self):
+        start = 1700000000.0
+        end = start + 600
+        ranges = []
+
+        def execute(query, session=None, rate_limiter=None):
+            ranges.append((query.global_start, query.global_end))
+            return response_messages.MESSAGE_EXCEEDED_MAXIMUM
+
+        query = Query(base_url=API_ENDPOINT, start=start, end=end)
+
+        with tempfile.TemporaryDirectory() as path, mock.patch.object(Query, "execute", execute):
+            QueryExecutor(path=path).execute_query(query=query)
+
+            self.assertEqual(os.listdir(path), [])
+
+        # the 11 samples end up in single-sample windows, which are dropped instead of being split again
+        self.assertEqual(ranges[0], (start, end))
+        self.assertEqual(len(ranges), 2 * 11 - 1)
+
+        for range_start, range_end in ranges:
+            self.assertLessEqual(range_start, range_end)
+
+    def test_execute_query_splits_two_samples(self):
+        start = 1700000000.0
+        end = start + 90
+        ranges = []
+
+        def execute(query, session=None, rate_limiter=None):
+            ranges.append((query.global_start, query.global_end))
+
+            if len(ranges) == 1:
+                return response_messages.MESSAGE_EXCEEDED_MAXIMUM
+
+            return {"status": "success", "data": {"resultType": "matrix", "result": []}}
+
+        query = Query(base_url=API_ENDPOINT, start=start, end=end)
+
+        with tempfile.TemporaryDirectory() as path, mock.patch.object(Query, "execute", execute):
+            QueryExecutor(path=path).execute_query(query=query)
+
+            self.assertEqual(sorted(os.listdir(path)), ["data0.json", "data1.json"])
+
+        self.assertEqual(ranges, [(start, end), (start + 60, end), (start, start)])
+
 
 if __name__ == "__main__":
     unittest.main()
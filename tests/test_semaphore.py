@@ -0,0 +1,69 @@
+import time
+import unittest
+
+from threading import Lock, Thread
+from unittest import mock
+
+from utilities.semaphore import RateLimiter, ThreadManager
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_rate_limiter_spacing(self):
+        rate_limiter = RateLimiter(interval=0.05)
+        starts = []
+
+        def acquire():
+            rate_limiter.acquire()
+            starts.append(time.monotonic())
+
+        threads = [Thread(target=acquire) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+
+        for previous, following in zip(starts, starts[1:]):
+            self.assertGreaterEqual(following - previous, 0.04)
+
+    def test_rate_limiter_without_interval(self):
+        rate_limiter = RateLimiter(interval=0)
+
+        with mock.patch("utilities.semaphore.time.sleep") as sleep:
+            for _ in range(100):
+                rate_limiter.acquire()
+
+        sleep.assert_not_called()
+
+
+class TestThreadManager(unittest.TestCase):
+    def test_execute_all_threads(self):
+        thread_manager = ThreadManager(semaphore_count=3, delay=0)
+        lock = Lock()
+        counts = {"active": 0, "peak": 0, "done": 0}
+
+        def work():
+            with lock:
+                counts["active"] += 1
+                counts["peak"] = max(counts["peak"], counts["active"])
+
+            time.sleep(0.01)
+
+            with lock:
+                counts["active"] -= 1
+                counts["done"] += 1
+
+        for _ in range(10):
+            thread_manager.add_thread(work)
+
+        thread_manager.execute_all_threads()
+
+        self.assertEqual(counts["done"], 10)
+        self.assertLessEqual(counts["peak"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,48 @@
+import functools
 import logging
-import re
 
 from datetime import datetime as dt
 from datetime import timedelta as td
 
 logger = logging.getLogger("alertmagnet")
 
+# days per unit and the position of the unit inside a past range
+PAST_RANGE_UNITS = {"y": (365, 1), "m": (28, 2), "w": (7, 3), "d": (1, 4)}
+
+
+# timedelta objects are immutable, so the parsed ranges can be shared between calls
+@functools.lru_cache(maxsize=64)
+def _parse_past_range(past_range: str) -> td:
+    # format: [<n>y][<n>m][<n>w][<n>d], units in this order and each at most once
+    total_days = 0
+    number = None
+    order = 0
+
+    for char in past_range:
+        if "0" <= char <= "9":
+            number = (0 if number is None else number * 10) + ord(char) - 48
+            continue
+
+        unit = PAST_RANGE_UNITS.get(char)
+
+        if unit is None or number is None or unit[1] <= order:
+            break
+
+        days, order = unit
+        total_days += number * days
+        number = None
+    else:
+        if number is None:
+            logger.debug("Total days: %d", total_days)
+            return td(days=total_days)
+
+    logger.error("Invalid past_range format: %s", past_range)
+    raise ValueError(f"Invalid past_range format: {past_range}")
+
 
 class Calc:
+    __slots__ = ("max_long_term",)
+
     def __init__(self):
         self.max_long_term = None
 
@@ -22,18 +57,4 @@ class Calc:
         return past.timestamp()
 
     def __parse_past_range(self, past_range: str) -> td:
-        match = re.match(r"(?:(\d+)y)?(?:(\d+)m)?(?:(\d+)w)?(?:(\d+)d)?", past_range)
-
-        if not match:
-            logger.error("Invalid past_range format: %s", past_range)
-            raise ValueError(f"Invalid past_range format: {past_range}")
-
-        years = int(match.group(1) or 0)
-        months = int(match.group(2) or 0)
-        weeks = int(match.group(3) or 0)
-        days = int(match.group(4) or 0)
-
-        total_days = years * 365 + months * 28 + weeks * 7 + days
-        logger.debug("Total days: %d", total_days)
-
-        return td(days=total_days)
+        return _parse_past_range(past_range)
@@ -20,6 +20,17 @@ import os
 
 from utilities.errors import ConfigFileNotExistsError, InvalidConfigValueError, RequiredConfigKeyNotFound
 
+# default value used for an empty entry and the type an entry is converted to
+CONFIG_VALUES = {
+    "timeout": (30, int),
+    "threshold": (None, int),
+    "delay": (0.25, float),
+    "cores": (12, int),
+    "max_long_term_storage": ("1y", str),
+    "prometheus_port": (8123, int),
+    "naptime_seconds": (86400, int),
+}
+
 
 def load_config(config_file: str):
     if not os.path.isfile(config_file):
@@ -40,57 +51,16 @@ def __parse_config(conf: dict):
         if conf["api_endpoint"] == "":
             raise RequiredConfigKeyNotFound("The config key 'api_endpoint' is required.")
 
-        if conf["timeout"] == "":
-            conf["timeout"] = 30
-        else:
-            conf["timeout"] = int(conf["timeout"])
-
-        if conf["threshold"] == "":
-            conf["threshold"] = None
-        else:
-            conf["threshold"] = int(conf["threshold"])
-
-        if conf["delay"] == "":
-            conf["delay"] = 0.25
-        else:
-            conf["delay"] = float(conf["delay"])
-
-        if conf["cores"] == "":
-            conf["cores"] = 12
-        else:
-            conf["cores"] = int(conf["cores"])
-
-        if conf["max_long_term_storage"] == "":
-            conf["max_long_term_storage"] = "1y"
-
-        if conf["prometheus_port"] == "":
-            conf["prometheus_port"] = 8123
-        else:
-            conf["prometheus_port"] = int(conf["prometheus_port"])
-
-        if conf["naptime_seconds"] == "":
-            conf["naptime_seconds"] = 86400
-        else:
-            conf["naptime_seconds"] = int(conf["naptime_seconds"])
-
-        if conf["log_to_file"].lower() == "true":
-            conf["log_to_file"] = True
-        else:
-            conf["log_to_file"] = False
-
-        match conf["log_level"]:
-            case "DEBUG":
-                conf["log_level"] = logging.DEBUG
-            case "INFO":
-                conf["log_level"] = logging.INFO
-            case "WARNING":
-                conf["log_level"] = logging.WARNING
-            case "ERROR":
-                conf["log_level"] = logging.ERROR
-            case "CRITICAL":
-                conf["log_level"] = logging.CRITICAL
-            case _:
-                raise InvalidConfigValueError(f"Invalid value {conf['log_level']} for 'log_level' in config file.")
+        for key, (default, cast) in CONFIG_VALUES.items():
+            value = conf[key]
+            conf[key] = default if value == "" else cast(value)
+
+        conf["log_to_file"] = conf["log_to_file"].lower() == "true"
+
+        log_level = logging.getLevelNamesMapping().get(conf["log_level"])
+        if log_level is None:
+            raise InvalidConfigValueError(f"Invalid value {conf['log_level']} for 'log_level' in config file.")
+        conf["log_level"] = log_level
 
     except KeyError as e:
         raise KeyError(f"Missing configuration parameter: {e}") from e
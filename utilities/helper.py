@@ -3,6 +3,7 @@ import os
 
 from io import StringIO
 
+import orjson
 import requests
 
 
@@ -11,6 +12,7 @@ class ResponseDummy(requests.Response):
         self.value = value
         self._text = value
         super().__init__()
+        self._content = orjson.dumps(value)  # body of the response, as read by callers of Response.content
 
     def json(self, **kwargs):
         return self.value
@@ -1,50 +1,54 @@
+import itertools
 import logging
 import time
-import uuid
 
-from threading import Thread, BoundedSemaphore
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
 logger = logging.getLogger("alertmagnet")
 
 
+class RateLimiter(object):
+    # spaces out the callers of acquire by at least `interval` seconds, in the order they arrive
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lock = Lock()
+        self.next_slot = 0.0
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class ThreadManager(object):
     def __init__(self, semaphore_count: int, delay: float):
-        self.semaphore = BoundedSemaphore(semaphore_count)
+        self.semaphore_count = semaphore_count
         self.delay = delay
-        self.threads: dict[str] = {}
+        self.rate_limiter = RateLimiter(interval=delay)
+        self.threads: dict[int] = {}
+        self.thread_ids = itertools.count()  # the ids only identify the functions inside this manager
 
-    def add_thread(self, func) -> str:
+    def add_thread(self, func) -> int:
         logger.debug("Adding thread: %s", func.__name__)
-        thread_uuid = uuid.uuid4().hex
-        self.threads[thread_uuid] = func
-
-        return thread_uuid
-
-    def wrapper_thread(self, func):
-        with self.semaphore:
-            func()
+        thread_id = next(self.thread_ids)
+        self.threads[thread_id] = func
 
-    def start_thread(self, thread_uuid: str = None) -> Thread:
-        if not thread_uuid:
-            return
+        return thread_id
 
-        func = self.threads[thread_uuid]
-
-        logger.debug("Starting thread: %s", func.__name__)
-        thread = Thread(target=self.wrapper_thread, args=(func,))
-        thread.start()
+    def execute_all_threads(self):
+        logger.debug("Executing all threads")
 
-        # TODO pop the used thread uuids from the list
+        # at most `semaphore_count` functions run at once, on threads reused by the following functions
+        with ThreadPoolExecutor(max_workers=self.semaphore_count) as executor:
+            futures = {thread_id: executor.submit(func) for thread_id, func in self.threads.items()}
 
-        return thread
+        for thread_id, future in futures.items():
+            exception = future.exception()
 
-    def execute_all_threads(self):
-        logger.debug("Executing all threads")
-        threads: list[Thread] = []
-        for key in self.threads:
-            thread = self.start_thread(thread_uuid=key)
-            threads.append(thread)
-            time.sleep(self.delay)
-
-        for thread in threads:
-            thread.join()
+            if exception is not None:
+                logger.error("Thread %s failed: %s", thread_id, exception, exc_info=exception)